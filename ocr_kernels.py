@@ -0,0 +1,114 @@
+"""
+Image preprocessing kernels for OCR
+Plain Python by default; compile_kernels() JIT-compiles them with Numba.
+Imported lazily by snipping_tool; Numba is optional.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
+
+
+def otsu_threshold(hist):
+    """Otsu's threshold for a 256-bin grayscale histogram
+
+    Shared by the Numba kernel and the NumPy preprocessing path.
+    """
+    total = hist.sum()
+    sum_all = 0.0
+    for i in range(256):
+        sum_all += i * hist[i]
+    
+    sum_b = 0.0
+    weight_b = 0
+    max_var = 0.0
+    threshold = 127
+    for t in range(256):
+        weight_b += hist[t]
+        if weight_b == 0:
+            continue
+        weight_f = total - weight_b
+        if weight_f == 0:
+            break
+        sum_b += t * hist[t]
+        mean_b = sum_b / weight_b
+        mean_f = (sum_all - sum_b) / weight_f
+        
+        # Maximize the between-class variance
+        var = float(weight_b) * float(weight_f) * (mean_b - mean_f) ** 2
+        if var > max_var:
+            max_var = var
+            threshold = t
+    return threshold
+
+
+def otsu(img):
+    """Otsu's threshold of a grayscale image"""
+    hist = np.zeros(256, np.int64)
+    h, w = img.shape
+    for y in range(h):
+        for x in range(w):
+            hist[img[y, x]] += 1
+    return otsu_threshold(hist)
+
+
+def binarize(rgba):
+    """Fused grayscale, contrast, sharpen and threshold kernel (Numba only)"""
+    H, W = rgba.shape[0], rgba.shape[1]
+    out = np.empty((H, W), np.uint8)
+    
+    # Fixed-point grayscale + contrast stretch around mid-gray
+    gray = np.empty((H, W), np.uint8)
+    for y in prange(H):
+        for x in range(W):
+            v = (77 * np.int64(rgba[y, x, 0]) + 150 * np.int64(rgba[y, x, 1])
+                 + 29 * np.int64(rgba[y, x, 2])) >> 8
+            v = (v - 128) * 2 + 128
+            gray[y, x] = np.uint8(min(max(v, 0), 255))
+    
+    # 3x3 sharpen (edges clamped)
+    for y in prange(H):
+        ym = max(y - 1, 0)
+        yp = min(y + 1, H - 1)
+        for x in range(W):
+            xm = max(x - 1, 0)
+            xp = min(x + 1, W - 1)
+            v = (5 * np.int64(gray[y, x]) - gray[ym, x] - gray[yp, x]
+                 - gray[y, xm] - gray[y, xp])
+            v = min(max(v, 0), 255)
+            out[y, x] = np.uint8(v)
+    
+    # Threshold with Otsu's method
+    threshold = otsu(out)
+    for y in prange(H):
+        for x in range(W):
+            out[y, x] = 255 if out[y, x] > threshold else 0
+    return out
+
+
+def compile_kernels():
+    """Replace the kernels with Numba-compiled versions and return binarize
+
+    Returns None when Numba is not installed. Explicit signatures compile
+    everything here rather than on the first call, and cache=True stores the
+    machine code in NUMBA_CACHE_DIR so later launches skip compilation.
+    nogil keeps the GUI thread responsive while a worker runs a kernel;
+    callers must still serialize calls to the parallel binarize kernel,
+    which is not safe to enter concurrently under every threading layer.
+    Must be called only once, from the GUI thread.
+    """
+    global otsu_threshold, otsu, binarize
+    if njit is None:
+        return None
+    
+    # Compiled in dependency order: each kernel resolves the already
+    # compiled globals it calls
+    otsu_threshold = njit('int64(int64[:])', cache=True, nogil=True)(otsu_threshold)
+    otsu = njit('int64(uint8[:,:])', cache=True, nogil=True)(otsu)
+    binarize = njit('uint8[:,:](uint8[:,:,:])', parallel=True, cache=True, nogil=True,
+                    fastmath=True)(binarize)
+    return binarize
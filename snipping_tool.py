@@ -6,22 +6,101 @@ Supports Windows, Linux, and macOS
 
 import sys
 import io
-from PIL import Image, ImageGrab, ImageEnhance, ImageFilter
-import pytesseract
-import pyperclip
+import os
+import hashlib
+import threading
+from collections import OrderedDict
+from PIL import Image
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QLabel, 
                              QPushButton, QVBoxLayout, QHBoxLayout, QComboBox,
                              QSystemTrayIcon, QMenu, QMessageBox, QRubberBand)
-from PyQt5.QtCore import Qt, QRect, QPoint, QSize, QTimer
-from PyQt5.QtGui import QPixmap, QPainter, QPen, QColor, QCursor, QIcon, QScreen
-import mss
-import numpy as np
+from PyQt5.QtCore import (Qt, QRect, QPoint, QSize, QTimer, QObject, QThread,
+                          pyqtSignal)
+from PyQt5.QtGui import QPixmap, QPainter, QPen, QColor, QCursor, QIcon, QScreen, QImage
+
+# numpy, mss, numba and the OCR engines are imported on first use to keep
+# startup fast; engines that are never selected are never loaded
+
+# Keep compiled Numba kernels (see ocr_kernels.py) in a stable per-user
+# directory so they are reused across launches regardless of the working
+# directory
+os.environ.setdefault('NUMBA_CACHE_DIR', os.path.expanduser('~/.cache/snipping_tool_numba'))
+
+
+def _build_kernels():
+    """Compile the Numba preprocessing kernel, or return None to use NumPy"""
+    try:
+        import ocr_kernels
+        return ocr_kernels.compile_kernels()
+    except Exception:
+        # Numba failing to compile or load its cache; the NumPy path
+        # produces the same result
+        return None
+
+
+_binarize = None
+_kernels_loaded = False
+_kernels_lock = threading.Lock()
+
+# The parallel kernel must not be entered from two threads at once: Numba's
+# workqueue threading layer aborts the process on concurrent use
+_binarize_lock = threading.Lock()
+
+
+def load_kernels():
+    """Return the fused Numba preprocessing kernel, compiling it on first use"""
+    global _binarize, _kernels_loaded
+    with _kernels_lock:
+        if not _kernels_loaded:
+            _binarize = _build_kernels()
+            _kernels_loaded = True
+    return _binarize
+
+
+# Number of OCR results kept for repeat extractions of the same image
+OCR_CACHE_SIZE = 64
+
+# Images are resized so their long side is at most OCR_MAX_SIDE and, for
+# small snips, their short side is at least OCR_MIN_SIDE before OCR
+OCR_MAX_SIDE = 2000
+OCR_MIN_SIDE = 300
+
+
+def qimage_to_pil(qimage):
+    """Convert a QImage to a PIL Image by copying its pixel buffer directly"""
+    import numpy as np
+    
+    qimage = qimage.convertToFormat(QImage.Format_RGBA8888)
+    width, height = qimage.width(), qimage.height()
+    stride = qimage.bytesPerLine()
+    
+    ptr = qimage.constBits()
+    ptr.setsize(height * stride)
+    
+    # Rows may be padded, so view by stride and crop to the visible width
+    arr = np.frombuffer(ptr, np.uint8).reshape(height, stride // 4, 4)[:, :width, :].copy()
+    return Image.fromarray(arr, 'RGBA')
+
+
+def pil_to_qimage(image):
+    """Convert a PIL Image to a QImage without an intermediate PNG"""
+    image = image.convert('RGBA')
+    data = image.tobytes('raw', 'RGBA')
+    qimage = QImage(data, image.width, image.height, image.width * 4,
+                    QImage.Format_RGBA8888)
+    
+    # Detach from the Python buffer, which is freed on return
+    return qimage.copy()
+
 
 class SnippingWidget(QWidget):
     """Overlay widget for selecting screen region"""
     
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, multi=False):
         super().__init__(parent)
+        self.multi = multi
+        self.regions = []
+        self.captures = []
         self.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint | Qt.Tool)
         self.setAttribute(Qt.WA_TranslucentBackground)
         self.setWindowOpacity(0.3)
@@ -29,26 +108,39 @@ class SnippingWidget(QWidget):
         self.begin = QPoint()
         self.end = QPoint()
         self.is_selecting = False
+        self._pending_update = False
+        self._painted_rect = QRect()
         self.screenshot = None
+        self.screenshot_origin = QPoint()
         self.rubber_band = QRubberBand(QRubberBand.Rectangle, self)
         
     def start_snip(self):
         """Start the snipping process"""
-        # Capture all screens
-        screen = QApplication.primaryScreen()
-        self.screenshot = screen.grabWindow(0)
-        
-        # Show fullscreen overlay
-        self.showFullScreen()
+        import mss
+        import numpy as np
+        
+        # Capture all screens as one RGB array
+        with mss.mss() as sct:
+            monitor = sct.monitors[0]
+            shot = sct.grab(monitor)
+        self.screenshot = np.frombuffer(shot.rgb, np.uint8).reshape(shot.height, shot.width, 3)
+        self.screenshot_origin = QPoint(monitor['left'], monitor['top'])
+        
+        # Show overlay across the whole virtual desktop
+        self.setGeometry(QApplication.primaryScreen().virtualGeometry())
+        self.show()
         self.setCursor(Qt.CrossCursor)
         
     def paintEvent(self, event):
         """Draw the selection overlay"""
-        if self.is_selecting:
+        if self.is_selecting or self.regions:
             painter = QPainter(self)
             painter.setPen(QPen(QColor(0, 255, 0, 255), 2, Qt.SolidLine))
             painter.setBrush(QColor(0, 255, 0, 30))
-            painter.drawRect(QRect(self.begin, self.end))
+            for region in self.regions:
+                painter.drawRect(region)
+            if self.is_selecting:
+                painter.drawRect(QRect(self.begin, self.end))
     
     def mousePressEvent(self, event):
         """Start selection"""
@@ -57,14 +149,30 @@ class SnippingWidget(QWidget):
         self.is_selecting = True
         self.rubber_band.setGeometry(QRect(self.begin, QSize()))
         self.rubber_band.show()
+        self._painted_rect = QRect()
         self.update()
     
     def mouseMoveEvent(self, event):
         """Update selection"""
         if self.is_selecting:
             self.end = event.pos()
-            self.rubber_band.setGeometry(QRect(self.begin, self.end).normalized())
-            self.update()
+            
+            # Coalesce high-rate mouse moves into at most one repaint per frame
+            if not self._pending_update:
+                self._pending_update = True
+                QTimer.singleShot(16, self._flush_update)
+    
+    def _flush_update(self):
+        """Repaint only the area covered by the old and new selection"""
+        self._pending_update = False
+        if not self.is_selecting:
+            return
+        rect = QRect(self.begin, self.end).normalized()
+        self.rubber_band.setGeometry(rect)
+        
+        dirty = rect.adjusted(-4, -4, 4, 4)
+        self.update(dirty.united(self._painted_rect))
+        self._painted_rect = dirty
     
     def mouseReleaseEvent(self, event):
         """Finish selection and capture"""
@@ -74,6 +182,16 @@ class SnippingWidget(QWidget):
         # Get selection rectangle
         rect = QRect(self.begin, self.end).normalized()
         
+        if self.multi:
+            # Keep the overlay open and collect regions until Enter
+            if rect.width() > 10 and rect.height() > 10:
+                pil_image = self.grab_region(rect)
+                if pil_image is not None:
+                    self.regions.append(rect)
+                    self.captures.append(pil_image)
+            self.update()
+            return
+        
         if rect.width() > 10 and rect.height() > 10:
             # Capture the selected area
             self.capture_region(rect)
@@ -82,30 +200,90 @@ class SnippingWidget(QWidget):
         self.close()
     
     def keyPressEvent(self, event):
-        """Cancel on ESC key"""
+        """Cancel on ESC key, finish a multi-region snip on Enter"""
         if event.key() == Qt.Key_Escape:
             self.is_selecting = False
             self.rubber_band.hide()
             self.hide()
             self.close()
+        elif self.multi and event.key() in (Qt.Key_Return, Qt.Key_Enter):
+            self.hide()
+            self.close()
+            if self.parent():
+                self.parent().process_batch_capture(self.captures)
+    
+    def grab_region(self, rect):
+        """Crop the selected region out of the screenshot as a PIL Image (None if empty)"""
+        # Map each corner through the screen it lies on, so a selection
+        # spanning monitors with different scale factors is kept whole
+        rect = QRect(self.mapToGlobal(rect.topLeft()), rect.size())
+        left, top = self._to_device(rect.topLeft(), rect.topLeft())
+        right, bottom = self._to_device(rect.topLeft() + QPoint(rect.width(), rect.height()),
+                                        rect.bottomRight())
+        
+        # Device pixels relative to the top-left of the mss capture
+        left -= self.screenshot_origin.x()
+        top -= self.screenshot_origin.y()
+        right -= self.screenshot_origin.x()
+        bottom -= self.screenshot_origin.y()
+        region = self.screenshot[max(top, 0):max(bottom, 0), max(left, 0):max(right, 0)]
+        if region.size == 0:
+            return None
+        return Image.fromarray(region)
+        
+    @staticmethod
+    def _to_device(point, pixel):
+        """Map a global point to device pixels using the screen holding pixel
+        
+        Qt keeps each screen's top-left in device pixels and scales its extent
+        by that screen's devicePixelRatio. Pixels in a gap between monitors
+        use the nearest screen.
+        """
+        screen = QApplication.screenAt(pixel)
+        if screen is None:
+            def distance(screen):
+                geometry = screen.geometry()
+                dx = max(geometry.left() - pixel.x(), 0, pixel.x() - geometry.right())
+                dy = max(geometry.top() - pixel.y(), 0, pixel.y() - geometry.bottom())
+                return dx * dx + dy * dy
+            screen = min(QApplication.screens(), key=distance)
+        origin = screen.geometry().topLeft()
+        ratio = screen.devicePixelRatio()
+        return (origin.x() + round((point.x() - origin.x()) * ratio),
+                origin.y() + round((point.y() - origin.y()) * ratio))
     
     def capture_region(self, rect):
         """Capture and process the selected region"""
-        if self.screenshot:
-            # Crop the screenshot to selected area
-            cropped = self.screenshot.copy(rect)
-            
-            # Convert to PIL Image
-            buffer = io.BytesIO()
-            cropped.save(buffer, "PNG")
-            buffer.seek(0)
-            pil_image = Image.open(buffer)
+        if self.screenshot is not None:
+            pil_image = self.grab_region(rect)
             
             # Send to main window for processing
-            if self.parent():
+            if pil_image is not None and self.parent():
                 self.parent().process_capture(pil_image)
 
 
+class OcrWorker(QObject):
+    """Runs preprocessing and OCR off the GUI thread"""
+    
+    finished = pyqtSignal(object, str)
+    failed = pyqtSignal(object, str)
+    
+    def __init__(self, ocr, image, engine):
+        super().__init__()
+        self.ocr = ocr
+        self.image = image
+        self.engine = engine
+        
+    def run(self):
+        """Run OCR and report the result"""
+        try:
+            text = self.ocr(self.image, self.engine)
+        except Exception as e:
+            self.failed.emit(self.image, str(e))
+        else:
+            self.finished.emit(self.image, text)
+
+
 class MainWindow(QMainWindow):
     """Main application window"""
     
@@ -113,6 +291,47 @@ class MainWindow(QMainWindow):
         super().__init__()
         self.init_ui()
         self.captured_image = None
+        self.captured_qimage = None
+        self._ocr_source = None
+        self._ocr_cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._tess = None
+        self._tess_loaded = False
+        self._tess_lock = threading.Lock()
+        self._ocr_jobs = []
+        self._gray_buf = None
+        self._sharp_buf = None
+        self._buffer_lock = threading.Lock()
+        
+    def _tess_api(self):
+        """Persistent Tesseract instance, loaded on first use (None to use pytesseract)"""
+        if not self._tess_loaded:
+            self._tess = self._create_tess_api()
+            self._tess_loaded = True
+        return self._tess
+        
+    def _create_tess_api(self):
+        """Load a persistent Tesseract instance, or None to use pytesseract"""
+        try:
+            import tesserocr
+        except ImportError:
+            return None
+        try:
+            return tesserocr.PyTessBaseAPI(psm=tesserocr.PSM.SINGLE_BLOCK)
+        except RuntimeError:
+            # tessdata not found; fall back to the tesseract executable
+            return None
+            
+    def closeEvent(self, event):
+        """Wait for running OCR jobs and release the Tesseract instance on exit"""
+        for thread, _ in list(self._ocr_jobs):
+            thread.quit()
+            thread.wait()
+        if self._tess is not None:
+            with self._tess_lock:
+                self._tess.End()
+                self._tess = None
+        super().closeEvent(event)
         
     def init_ui(self):
         """Initialize the user interface"""
@@ -145,6 +364,25 @@ class MainWindow(QMainWindow):
         """)
         controls.addWidget(self.snip_btn)
         
+        # Multi-region snip button
+        self.multi_snip_btn = QPushButton("🗂 Snip Regions (Multi)")
+        self.multi_snip_btn.setToolTip("Select several regions, then press Enter to extract them all")
+        self.multi_snip_btn.clicked.connect(self.start_multi_snipping)
+        self.multi_snip_btn.setStyleSheet("""
+            QPushButton {
+                background-color: #009688;
+                color: white;
+                border: none;
+                padding: 10px;
+                font-size: 14px;
+                border-radius: 5px;
+            }
+            QPushButton:hover {
+                background-color: #00796B;
+            }
+        """)
+        controls.addWidget(self.multi_snip_btn)
+        
         # Paste button
         self.paste_btn = QPushButton("📋 Paste Image (Ctrl+V)")
         self.paste_btn.clicked.connect(self.paste_from_clipboard)
@@ -241,7 +479,32 @@ class MainWindow(QMainWindow):
                 background-color: #cccccc;
             }
         """)
-        layout.addWidget(self.copy_btn)
+        
+        # Copy image button
+        self.copy_image_btn = QPushButton("🖼 Copy Image")
+        self.copy_image_btn.clicked.connect(self.copy_image_to_clipboard)
+        self.copy_image_btn.setEnabled(False)
+        self.copy_image_btn.setStyleSheet("""
+            QPushButton {
+                background-color: #607D8B;
+                color: white;
+                border: none;
+                padding: 10px;
+                font-size: 14px;
+                border-radius: 5px;
+            }
+            QPushButton:hover {
+                background-color: #455A64;
+            }
+            QPushButton:disabled {
+                background-color: #cccccc;
+            }
+        """)
+        
+        copy_row = QHBoxLayout()
+        copy_row.addWidget(self.copy_btn, 1)
+        copy_row.addWidget(self.copy_image_btn)
+        layout.addLayout(copy_row)
         
         # Setup global hotkey (simplified - use keyboard library for better support)
         self.setup_shortcuts()
@@ -262,25 +525,29 @@ class MainWindow(QMainWindow):
     def start_snipping(self):
         """Start the snipping process"""
         self.hide()  # Hide main window during snipping
-        QTimer.singleShot(100, self._show_snipping_widget)
+        QTimer.singleShot(100, lambda: self._show_snipping_widget(multi=False))
         
-    def _show_snipping_widget(self):
+    def start_multi_snipping(self):
+        """Start snipping several regions for batch OCR"""
+        self.hide()
+        QTimer.singleShot(100, lambda: self._show_snipping_widget(multi=True))
+        
+    def _show_snipping_widget(self, multi):
         """Show snipping widget after delay"""
-        self.snipping_widget = SnippingWidget(self)
+        self.snipping_widget = SnippingWidget(self, multi=multi)
         self.snipping_widget.start_snip()
         
-    def process_capture(self, image):
-        """Process captured image"""
+    def process_capture(self, pil_image, qimage=None):
+        """Process captured image, reusing its QImage for display if given"""
         self.show()  # Show main window again
-        self.captured_image = image
+        self.captured_image = pil_image
+        self._ocr_source = None  # Results of pending OCR jobs are now stale
         
         # Display image
-        img_byte_arr = io.BytesIO()
-        image.save(img_byte_arr, format='PNG')
-        img_byte_arr.seek(0)
-        
-        pixmap = QPixmap()
-        pixmap.loadFromData(img_byte_arr.read())
+        if qimage is None:
+            qimage = pil_to_qimage(pil_image)
+        self.captured_qimage = qimage
+        pixmap = QPixmap.fromImage(qimage)
         
         # Scale to fit
         scaled_pixmap = pixmap.scaled(self.image_label.size(), 
@@ -288,30 +555,89 @@ class MainWindow(QMainWindow):
                                       Qt.SmoothTransformation)
         self.image_label.setPixmap(scaled_pixmap)
         
-        # Enable extract button
+        # Enable extract and copy image buttons
         self.extract_btn.setEnabled(True)
+        self.copy_image_btn.setEnabled(True)
         self.text_label.setText("Image captured! Click 'Extract Text' to process.")
         
+    def process_batch_capture(self, images):
+        """Preview the last of several captured regions and OCR them all"""
+        if not images:
+            self.show()
+            return
+            
+        self.process_capture(images[-1])
+        self.extract_text_batch(images)
+        
     def preprocess_image(self, image):
         """Preprocess image for better OCR accuracy"""
-        # Convert to grayscale
-        gray = image.convert('L')
-        
-        # Enhance contrast
-        enhancer = ImageEnhance.Contrast(gray)
-        enhanced = enhancer.enhance(2.0)
-        
-        # Sharpen
-        sharpened = enhanced.filter(ImageFilter.SHARPEN)
-        
-        # Convert to numpy for thresholding
-        img_array = np.array(sharpened)
-        
-        # Apply adaptive thresholding
-        threshold = np.mean(img_array)
-        binary = (img_array > threshold) * 255
+        return Image.fromarray(self.preprocess_array(image))
+        
+    def preprocess_array(self, image):
+        """Preprocess image for OCR into a binary uint8 numpy array"""
+        import numpy as np
+        import ocr_kernels
+        
+        # Scale into the size range where Tesseract is fast and accurate
+        width, height = image.size
+        scale = min(OCR_MAX_SIDE / max(width, height),
+                    max(1.0, OCR_MIN_SIDE / min(width, height)))
+        if scale != 1.0:
+            image = image.resize((max(1, round(width * scale)), max(1, round(height * scale))),
+                                 Image.LANCZOS)
+        
+        binarize = load_kernels()
+        if binarize is not None:
+            # Single fused pass over the raw RGBA buffer
+            rgba = np.array(image.convert('RGBA'))
+            with _binarize_lock:
+                return binarize(rgba)
+        
+        # Reuse scratch buffers sized to the largest image seen so far;
+        # the lock keeps concurrent OCR jobs from sharing them
+        height, width = image.height, image.width
+        with self._buffer_lock:
+            if self._gray_buf is None or self._gray_buf.size < (height + 2) * (width + 2):
+                self._gray_buf = np.empty((height + 2) * (width + 2), np.int32)
+            if self._sharp_buf is None or self._sharp_buf.size < height * width:
+                self._sharp_buf = np.empty(height * width, np.int32)
+            padded = self._gray_buf[:(height + 2) * (width + 2)].reshape(height + 2, width + 2)
+            sharpened = self._sharp_buf[:height * width].reshape(height, width)
+            gray = padded[1:-1, 1:-1]
+            
+            # Convert to grayscale in fixed point, one channel plane at a time
+            rgb = np.asarray(image.convert('RGB'))
+            np.multiply(rgb[..., 0], 77, out=gray, dtype=np.int32)
+            np.multiply(rgb[..., 1], 150, out=sharpened, dtype=np.int32)
+            gray += sharpened
+            np.multiply(rgb[..., 2], 29, out=sharpened, dtype=np.int32)
+            gray += sharpened
+            gray >>= 8
+            
+            # Enhance contrast around mid-gray: (v - 128) * 2 + 128
+            gray *= 2
+            gray -= 128
+            np.clip(gray, 0, 255, out=gray)
+            
+            # Sharpen with a 3x3 kernel, replicating the edges
+            padded[0, :] = padded[1, :]
+            padded[-1, :] = padded[-2, :]
+            padded[:, 0] = padded[:, 1]
+            padded[:, -1] = padded[:, -2]
+            np.multiply(gray, 5, out=sharpened)
+            sharpened -= padded[:-2, 1:-1]
+            sharpened -= padded[2:, 1:-1]
+            sharpened -= padded[1:-1, :-2]
+            sharpened -= padded[1:-1, 2:]
+            np.clip(sharpened, 0, 255, out=sharpened)
+            
+            # Apply adaptive thresholding with Otsu's method
+            threshold = ocr_kernels.otsu_threshold(np.bincount(sharpened.ravel(), minlength=256))
+            binary = np.empty((height, width), np.uint8)
+            np.greater(sharpened, threshold, out=binary.view(np.bool_))
+            binary *= 255
         
-        return Image.fromarray(binary.astype(np.uint8))
+        return binary
         
     def extract_text(self):
         """Extract text from captured image"""
@@ -319,46 +645,206 @@ class MainWindow(QMainWindow):
             return
             
         self.text_label.setText("Processing... Please wait.")
-        QApplication.processEvents()
+        self.extract_btn.setEnabled(False)
         
-        try:
-            # Preprocess image
-            processed_image = self.preprocess_image(self.captured_image)
+        # OCR runs on a worker thread so the UI stays responsive
+        engine = self.ocr_combo.currentText()
+        self._ocr_source = self.captured_image
+        self._start_ocr_job(OcrWorker(self.run_ocr, self.captured_image, engine))
+        
+    def extract_text_batch(self, images):
+        """Extract text from several images on a worker thread"""
+        self.text_label.setText(f"Processing {len(images)} regions... Please wait.")
+        self.extract_btn.setEnabled(False)
+        
+        engine = self.ocr_combo.currentText()
+        self._ocr_source = images
+        self._start_ocr_job(OcrWorker(self.run_ocr_batch, images, engine))
+        
+    def _start_ocr_job(self, worker):
+        """Run an OCR worker on its own thread"""
+        thread = QThread(self)
+        worker.moveToThread(thread)
+        thread.started.connect(worker.run)
+        worker.finished.connect(self._on_ocr_done)
+        worker.failed.connect(self._on_ocr_failed)
+        worker.finished.connect(thread.quit)
+        worker.failed.connect(thread.quit)
+        thread.finished.connect(self._on_ocr_thread_finished)
+        self._ocr_jobs.append((thread, worker))
+        thread.start()
+        
+    def _on_ocr_thread_finished(self):
+        """Drop a finished OCR job"""
+        thread = self.sender()
+        for job in self._ocr_jobs:
+            if job[0] is thread:
+                self._ocr_jobs.remove(job)
+                job[1].deleteLater()
+                thread.deleteLater()
+                break
+                
+    def run_ocr(self, image, engine):
+        """Preprocess an image and extract its text (called from worker threads)"""
+        error = self._engine_error(engine)
+        if error:
+            return error
             
-            # Get selected OCR engine
-            engine = self.ocr_combo.currentText()
+        processed, key = self._prepare_ocr(image, engine)
+        text = self._cached_ocr(key)
+        if text is None:
+            text = self._ocr_processed(processed, engine)
+            self._cache_ocr_result(key, text)
+        return text
+        
+    def run_ocr_batch(self, images, engine):
+        """Extract text from several images (called from worker threads)"""
+        error = self._engine_error(engine)
+        if error:
+            return error
             
-            if "Tesseract" in engine:
-                # Use Tesseract
-                text = pytesseract.image_to_string(processed_image, config='--psm 6')
-            elif "EasyOCR" in engine:
-                try:
-                    import easyocr
-                    reader = easyocr.Reader(['en'])
-                    result = reader.readtext(np.array(processed_image))
-                    text = '\n'.join([item[1] for item in result])
-                except ImportError:
-                    text = "EasyOCR not installed. Please install with: pip install easyocr"
+        # Serve repeats from the cache and OCR each distinct image only once
+        prepared = [self._prepare_ocr(image, engine) for image in images]
+        texts = {key: self._cached_ocr(key) for _, key in prepared}
+        missing = {key: processed for processed, key in prepared if texts[key] is None}
+        
+        if missing:
+            if "Tesseract" in engine and self._parallel_tesseract():
+                import asyncio
+                results = asyncio.run(self._ocr_many(list(missing.values())))
             else:
-                text = "Cloud API not implemented in this demo"
+                results = [self._ocr_processed(processed, engine)
+                           for processed in missing.values()]
+            for key, text in zip(missing, results):
+                texts[key] = text
+                self._cache_ocr_result(key, text)
+                
+        # Leave the result empty so the "No text detected" message shows
+        if not any(text.strip() for text in texts.values()):
+            return ""
             
-            if text.strip():
-                self.text_label.setText(text)
-                self.extracted_text = text
-                self.copy_btn.setEnabled(True)
-            else:
-                self.text_label.setText("No text detected in image")
-                self.copy_btn.setEnabled(False)
+        return '\n\n'.join(f"--- Region {n} ---\n{texts[key].strip()}"
+                           for n, (_, key) in enumerate(prepared, 1))
+        
+    def _parallel_tesseract(self):
+        """Whether to OCR batches with concurrent tesseract processes
+        
+        Only used without a persistent tesserocr instance, which already has
+        the model loaded and beats spawning a process per image.
+        """
+        with self._tess_lock:
+            if self._tess_api() is not None:
+                return False
+        try:
+            import aiopytesseract  # noqa: F401
+        except ImportError:
+            return False
+        return True
+        
+    def _engine_error(self, engine):
+        """Message explaining why an OCR engine cannot run, or None"""
+        if "Tesseract" in engine:
+            return None
+        if "EasyOCR" in engine:
+            try:
+                import easyocr  # noqa: F401
+            except ImportError:
+                return "EasyOCR not installed. Please install with: pip install easyocr"
+            return None
+        return "Cloud API not implemented in this demo"
+        
+    def _prepare_ocr(self, image, engine):
+        """Preprocess an image and compute its OCR cache key"""
+        processed = self.preprocess_array(image)
+        
+        # The array is hashed in place rather than copied out with tobytes()
+        digest = hashlib.blake2b(memoryview(processed).cast('B'), digest_size=16).digest()
+        return processed, (engine, processed.shape, digest)
+        
+    def _ocr_processed(self, processed, engine):
+        """Run an OCR engine on a preprocessed array"""
+        processed_image = Image.fromarray(processed)  # Shares the array's memory
+        
+        if "Tesseract" in engine:
+            # Use Tesseract, through the preloaded API when available
+            with self._tess_lock:
+                tess = self._tess_api()
+                if tess is not None:
+                    tess.SetImage(processed_image)
+                    return tess.GetUTF8Text()
+            import pytesseract
+            return pytesseract.image_to_string(processed_image, config='--psm 6')
+            
+        import easyocr
+        reader = easyocr.Reader(['en'])
+        result = reader.readtext(processed)
+        return '\n'.join([item[1] for item in result])
+        
+    async def _ocr_many(self, images):
+        """Run one tesseract process per preprocessed array, up to one per CPU at a time"""
+        import asyncio
+        import aiopytesseract
+        
+        semaphore = asyncio.Semaphore(os.cpu_count() or 1)
+        
+        async def one(processed):
+            async with semaphore:
+                buffer = io.BytesIO()
+                Image.fromarray(processed).save(buffer, 'PNG')
+                return await aiopytesseract.image_to_string(buffer.getvalue(), psm=6)
                 
-        except Exception as e:
-            self.text_label.setText(f"Error during OCR: {str(e)}")
-            QMessageBox.warning(self, "OCR Error", f"Failed to extract text: {str(e)}")
+        return await asyncio.gather(*[one(processed) for processed in images])
+        
+    def _on_ocr_done(self, image, text):
+        """Show the text extracted by a worker"""
+        if image is not self._ocr_source:
+            # A newer capture replaced this one while OCR was running
+            return
+            
+        self.extract_btn.setEnabled(True)
+        if text.strip():
+            self.text_label.setText(text)
+            self.extracted_text = text
+            self.copy_btn.setEnabled(True)
+        else:
+            self.text_label.setText("No text detected in image")
+            self.copy_btn.setEnabled(False)
+            
+    def _on_ocr_failed(self, image, message):
+        """Report an OCR error raised in a worker"""
+        if image is not self._ocr_source:
+            return
+            
+        self.extract_btn.setEnabled(True)
+        self.text_label.setText(f"Error during OCR: {message}")
+        QMessageBox.warning(self, "OCR Error", f"Failed to extract text: {message}")
+            
+    def _cached_ocr(self, key):
+        """Return a cached OCR result, or None"""
+        with self._cache_lock:
+            text = self._ocr_cache.get(key)
+            if text is not None:
+                self._ocr_cache.move_to_end(key)
+            return text
+            
+    def _cache_ocr_result(self, key, text):
+        """Store an OCR result, evicting the least recently used entry"""
+        with self._cache_lock:
+            self._ocr_cache[key] = text
+            if len(self._ocr_cache) > OCR_CACHE_SIZE:
+                self._ocr_cache.popitem(last=False)
             
     def copy_to_clipboard(self):
         """Copy extracted text to clipboard"""
         if hasattr(self, 'extracted_text'):
-            pyperclip.copy(self.extracted_text)
+            QApplication.clipboard().setText(self.extracted_text)
             QMessageBox.information(self, "Success", "Text copied to clipboard!")
+            
+    def copy_image_to_clipboard(self):
+        """Copy captured image to clipboard"""
+        if self.captured_qimage is not None:
+            QApplication.clipboard().setImage(self.captured_qimage)
+            QMessageBox.information(self, "Success", "Image copied to clipboard!")
     
     def paste_from_clipboard(self):
         """Paste and process image from clipboard"""
@@ -374,20 +860,12 @@ class MainWindow(QMainWindow):
                 QMessageBox.warning(self, "No Image", "No valid image found in clipboard")
                 return
             
-            # Convert QImage to PIL Image using QBuffer
-            from PyQt5.QtCore import QBuffer, QIODevice
-            
-            buffer = QBuffer()
-            buffer.open(QIODevice.WriteOnly)
-            q_image.save(buffer, "PNG")
-            buffer.close()
-            
-            # Get bytes and convert to PIL Image
-            image_bytes = buffer.data().data()
-            pil_image = Image.open(io.BytesIO(image_bytes))
+            # Convert QImage to PIL Image straight from its pixel buffer
+            q_image = q_image.convertToFormat(QImage.Format_RGBA8888)
+            pil_image = qimage_to_pil(q_image)
             
             # Process the pasted image
-            self.process_capture(pil_image)
+            self.process_capture(pil_image, q_image)
             self.text_label.setText("Image pasted from clipboard! Click 'Extract Text' to process.")
             
         elif mime_data.hasUrls():
@@ -410,13 +888,10 @@ class MainWindow(QMainWindow):
                               "3. Copying an image file")
 
 
-def main():
-    """Main entry point"""
-    app = QApplication(sys.argv)
-    app.setStyle('Fusion')
-    
-    # Check if Tesseract is installed
+def check_tesseract():
+    """Warn if the Tesseract executable cannot be found"""
     try:
+        import pytesseract
         pytesseract.get_tesseract_version()
     except Exception as e:
         QMessageBox.warning(None, "Tesseract Not Found", 
@@ -425,10 +900,22 @@ def main():
                           "- Windows: https://github.com/UB-Mannheim/tesseract/wiki\n"
                           "- Linux: sudo apt install tesseract-ocr\n"
                           "- macOS: brew install tesseract")
+
+
+def main():
+    """Main entry point"""
+    app = QApplication(sys.argv)
+    app.setStyle('Fusion')
     
     window = MainWindow()
     window.show()
     
+    # Check for Tesseract and load the preprocessing kernels once the window
+    # is up. The kernels are loaded on the GUI thread: compiling Numba's
+    # parallel kernels from a worker thread hangs the TBB pool at exit.
+    QTimer.singleShot(0, check_tesseract)
+    QTimer.singleShot(0, load_kernels)
+    
     sys.exit(app.exec_())
 
 